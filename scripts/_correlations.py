@@ -0,0 +1,51 @@
+"""
+Storms and Rogozkin FGR correlations and their analytic partial
+derivatives, shared by figure14_fgr_comparison.py and
+sensitivity_analysis.py.
+
+    Storms:   FGR = 100 / {exp[0.0025 × (90 × ρ^0.77 / BU^0.09 − T)] + 1}
+    Rogozkin: FGR = 3.05 × BU^1.92 × exp(−2086 / T_°C)
+
+All functions accept scalars or NumPy arrays (T in K, BU in %FIMA,
+TD in %TD).
+"""
+
+import numpy as np
+
+
+def _storms_threshold(BU, TD):
+    """Density/burnup term 90 × ρ^0.77 / BU^0.09 of the Storms exponent (K)."""
+    return 90.0 * TD**0.77 / BU**0.09
+
+
+def storms_fgr(T_K, BU, TD):
+    """Storms FGR correlation. T in K, BU in %FIMA, TD in %TD."""
+    return 100.0 / (np.exp(0.0025 * (_storms_threshold(BU, TD) - T_K)) + 1.0)
+
+
+def rogozkin_fgr(T_K, BU):
+    """Rogozkin FGR correlation. T in K (converted to °C internally)."""
+    T_C = T_K - 273.15
+    return 3.05 * BU**1.92 * np.exp(-2086.0 / T_C)
+
+
+def storms_fgr_grad(T_K, BU, TD):
+    """Storms FGR and its analytic partials (∂f/∂T, ∂f/∂BU, ∂f/∂TD)."""
+    # The power-law term is evaluated once; its BU and TD derivatives are
+    # -0.09·A/BU and 0.77·A/TD, so the partials need no further powers.
+    A = _storms_threshold(BU, TD)
+    fgr = 100.0 / (np.exp(0.0025 * (A - T_K)) + 1.0)
+    slope = 0.0025 * fgr * (1.0 - fgr / 100.0)  # logistic derivative
+    dfdT = slope
+    dfdBU = slope * 0.09 * A / BU
+    dfdTD = -slope * 0.77 * A / TD
+    return fgr, dfdT, dfdBU, dfdTD
+
+
+def rogozkin_fgr_grad(T_K, BU):
+    """Rogozkin FGR and its analytic partials (∂f/∂T, ∂f/∂BU)."""
+    T_C = T_K - 273.15
+    fgr = 3.05 * BU**1.92 * np.exp(-2086.0 / T_C)
+    dfdT = fgr * 2086.0 / T_C**2  # d/dT_K == d/dT_C
+    dfdBU = fgr * 1.92 / BU
+    return fgr, dfdT, dfdBU
@@ -0,0 +1,53 @@
+"""
+ROADRUNNER UN MiniFuel irradiation matrix (from Tables 2 & 3), shared by the
+figure and analysis scripts as pre-typed NumPy arrays.
+
+Specimens are ordered by target (RRN01–RRN06) and, within each target, by
+subcapsule from S6 down to S1.
+"""
+
+import numpy as np
+
+SAMPLE_ID = np.array([
+    "RRN01-6", "RRN01-5", "RRN01-4", "RRN01-3", "RRN01-2", "RRN01-1",
+    "RRN02-6", "RRN02-5", "RRN02-4", "RRN02-3", "RRN02-2", "RRN02-1",
+    "RRN03-6", "RRN03-5", "RRN03-4", "RRN03-3", "RRN03-2", "RRN03-1",
+    "RRN04-6", "RRN04-5", "RRN04-4", "RRN04-3", "RRN04-2", "RRN04-1",
+    "RRN05-6", "RRN05-5", "RRN05-4", "RRN05-3", "RRN05-2", "RRN05-1",
+    "RRN06-6", "RRN06-5", "RRN06-4", "RRN06-3", "RRN06-2", "RRN06-1",
+], dtype="U8")
+
+TARGET = np.repeat(np.arange(1, 7), 6)
+
+# Discharge burnup (%FIMA)
+BU = np.array([
+    7.058, 7.470, 7.657, 7.839, 7.730, 7.576,
+    7.338, 7.726, 7.908, 8.081, 8.020, 7.716,
+    3.498, 3.681, 3.741, 3.852, 3.842, 3.740,
+    5.936, 6.229, 6.399, 6.517, 6.451, 6.237,
+    5.485, 5.751, 5.985, 5.990, 5.983, 5.863,
+    3.757, 4.027, 4.096, 4.217, 4.163, 3.958,
+], dtype=np.float64)
+
+# TAVA fuel temperature (K)
+T_K = np.array([
+    1190, 1190, 1181, 1183, 1163, 1182,
+    877, 881, 1183, 1479, 1487, 1181,
+    1184, 1187, 1181, 1172, 1187, 1181,
+    875, 881, 1172, 1483, 1490, 1175,
+    1191, 1183, 1183, 1179, 1182, 1175,
+    877, 881, 1183, 1479, 1487, 1181,
+], dtype=np.float64)
+
+# As-fabricated density (%TD)
+TD = np.array([
+    92.89, 94.21, 93.43, 94.73, 95.21, 95.76,
+    94.79, 94.36, 93.19, 92.00, 95.01, 95.49,
+    89.09, 86.27, 89.02, 95.21, 95.91, 94.50,
+    94.33, 95.45, 95.59, 93.48, 96.05, 95.60,
+    87.30, 88.57, 88.19, 93.27, 94.07, 96.32,
+    94.10, 95.43, 95.63, 95.14, 96.14, 95.01,
+], dtype=np.float64)
+
+# Row indices of each target's specimens, for per-target plotting loops
+TARGET_IDX = {t: np.flatnonzero(TARGET == t) for t in range(1, 7)}
@@ -0,0 +1,42 @@
+"""
+Plot configuration shared by the ROADRUNNER figure scripts: the common
+command line, per-target labels/markers/colours, and axis formatting.
+"""
+
+import argparse
+
+import matplotlib
+
+# Fast zlib level for the 300-dpi PNGs: ~30% quicker to encode, larger files
+PNG_PIL_KWARGS = {"compress_level": 1, "optimize": False}
+
+TARGET_LABELS = {1: "RRN01", 2: "RRN02", 3: "RRN03",
+                 4: "RRN04", 5: "RRN05", 6: "RRN06"}
+MARKERS = {1: "o", 2: "s", 3: "^", 4: "D", 5: "v", 6: "H"}
+COLORS = {1: "#1f77b4", 2: "#ff7f0e", 3: "#2ca02c",
+          4: "#d62728", 5: "#9467bd", 6: "#8c564b"}
+
+
+def setup_axes(ax, xlabel, ylabel, **grid_kw):
+    """Label both axes (12 pt) and draw a light background grid."""
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.grid(True, **{"alpha": 0.3, **grid_kw})
+
+
+def script_args(description, parser=None):
+    """
+    Parse the figure scripts' command line (``--show``).
+
+    Without ``--show`` the Agg backend is selected, so batch runs never
+    initialise a GUI backend or block on ``plt.show()``. Pass ``parser`` to
+    add ``--show`` to a parser that already defines other options.
+    """
+    if parser is None:
+        parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--show", action="store_true",
+                        help="display the figure(s) interactively after saving")
+    args = parser.parse_args()
+    if not args.show:
+        matplotlib.use("Agg")
+    return args
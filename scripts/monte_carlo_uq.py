@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Monte-Carlo Uncertainty Quantification: sampling-based counterpart to the
+first-order propagation in sensitivity_analysis.py for the Storms and
+Rogozkin FGR correlations and the Ross swelling correlation applied to
+the ROADRUNNER UN MiniFuel irradiation matrix.
+
+Method:
+    Each specimen's (T, BU, ρ) is perturbed N_DRAWS times with independent
+    normal deviates of standard deviation (ΔT, ΔBU, Δρ). The sample mean
+    and standard deviation of each correlation over the draws are reported.
+
+    The scalar correlation kernels and the per-specimen sampling loop are
+    compiled with Numba (@njit, parallel over specimens) when it is
+    installed; otherwise the same code runs as plain Python.
+
+Input uncertainties:
+    ΔT  = ±50 K    (thermal design margin + SiC thermometry resolution)
+    ΔBU = ±0.5 %FIMA (neutronic calculation uncertainty)
+    Δρ  = ±2 %TD   (as-fabricated density variability)
+
+Reference:
+    Adorno Lopes et al., "ROADRUNNER Uranium Nitride MiniFuel: Experimental
+    Design, Fabrication and Pre-irradiation Baseline Characterization for
+    Accelerated Burnup Testing", Nuclear Engineering and Design (2025/2026).
+"""
+
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to interpreted loops
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+from _matrix import SAMPLE_ID, BU, T_K, TD
+
+# ===================================================================
+# Correlation kernels (scalar, compiled when Numba is available)
+# ===================================================================
+
+@njit(fastmath=True, cache=True)
+def storms_fgr_nb(T_K, BU, TD):
+    """Storms FGR correlation. T in K, BU in %FIMA, TD in %TD."""
+    return 100.0 / (math.exp(0.0025 * (90.0 * math.pow(TD, 0.77)
+                                       / math.pow(BU, 0.09) - T_K)) + 1.0)
+
+
+@njit(fastmath=True, cache=True)
+def rogozkin_fgr_nb(T_K, BU):
+    """Rogozkin FGR correlation. T in K (converted to °C internally)."""
+    T_C = T_K - 273.15
+    return 3.05 * math.pow(BU, 1.92) * math.exp(-2086.0 / T_C)
+
+
+@njit(fastmath=True, cache=True)
+def ross_swelling_nb(T_K, BU, TD):
+    """Ross et al. (1990) volumetric swelling ΔV/V (%) for UN fuel."""
+    return 4.7e-11 * math.pow(T_K, 3.12) * math.pow(BU, 0.83) * math.sqrt(TD)
+
+
+@njit(parallel=True, cache=True)
+def mc_propagate(T, BU, TD, eps):
+    """
+    Evaluate the correlations at every perturbed input.
+
+    Parameters
+    ----------
+    T, BU, TD : ndarray, shape (n,)
+        Nominal specimen temperature (K), burnup (%FIMA), density (%TD).
+    eps : ndarray, shape (3, n, N)
+        Absolute perturbations of (T, BU, TD) for each specimen and draw.
+
+    Returns
+    -------
+    ndarray, shape (3, n, N)
+        Storms FGR, Rogozkin FGR and Ross swelling for each draw.
+    """
+    n = T.shape[0]
+    N = eps.shape[2]
+    out = np.empty((3, n, N))
+    for i in prange(n):
+        for k in range(N):
+            t = T[i] + eps[0, i, k]
+            bu = BU[i] + eps[1, i, k]
+            td = TD[i] + eps[2, i, k]
+            out[0, i, k] = storms_fgr_nb(t, bu, td)
+            out[1, i, k] = rogozkin_fgr_nb(t, bu)
+            out[2, i, k] = ross_swelling_nb(t, bu, td)
+    return out
+
+
+# ===================================================================
+# Sampling Parameters
+# ===================================================================
+DELTA_T = 50.0    # K
+DELTA_BU = 0.5    # %FIMA
+DELTA_TD = 2.0    # %TD
+
+N_DRAWS = 10_000
+SEED = 20250207
+
+
+def main():
+    """Run the Monte-Carlo propagation, print the table and save the CSV."""
+    # ===============================================================
+    # Run Monte-Carlo propagation
+    # ===============================================================
+    # Perturbations are drawn up front so results are reproducible regardless
+    # of how the compiled loop is scheduled across threads.
+    rng = np.random.default_rng(SEED)
+    eps = rng.standard_normal((3, len(SAMPLE_ID), N_DRAWS))
+    eps *= np.array([DELTA_T, DELTA_BU, DELTA_TD])[:, None, None]
+
+    draws = mc_propagate(T_K, BU, TD, eps)
+    mean = draws.mean(axis=2)
+    std = draws.std(axis=2, ddof=1)
+
+    res_df = pd.DataFrame({
+        "Sample_ID": SAMPLE_ID,
+        "T_K": T_K,
+        "BU_FIMA": BU,
+        "TD_pct": TD,
+        "FGR_Storms_mean": mean[0],
+        "sigma_Storms": std[0],
+        "FGR_Rogozkin_mean": mean[1],
+        "sigma_Rogozkin": std[1],
+        "Swelling_Ross_mean": mean[2],
+        "sigma_Ross": std[2],
+    })
+
+    # ===============================================================
+    # Print summary table
+    # ===============================================================
+    print("=" * 100)
+    print(f"Monte-Carlo UQ ({N_DRAWS} draws per specimen)")
+    print(f"Input uncertainties: ΔT = ±{DELTA_T} K, ΔBU = ±{DELTA_BU} %FIMA, Δρ = ±{DELTA_TD} %TD")
+    print("=" * 100)
+    print(f"{'Sample':<12} {'T(K)':>7} {'BU':>7} {'ρ(%TD)':>8} "
+          f"{'FGR_S(%)':>9} {'σ_S(%)':>7} {'FGR_R(%)':>9} {'σ_R(%)':>7} "
+          f"{'ΔV/V(%)':>8} {'σ_V(%)':>7}")
+    print("-" * 100)
+
+    row_fmt = {
+        "Sample_ID": "{:<12}".format,
+        "T_K": "{:7.1f}".format,
+        "BU_FIMA": "{:7.2f}".format,
+        "TD_pct": "{:8.2f}".format,
+        "FGR_Storms_mean": "{:9.2f}".format,
+        "sigma_Storms": "{:7.2f}".format,
+        "FGR_Rogozkin_mean": "{:9.2f}".format,
+        "sigma_Rogozkin": "{:7.2f}".format,
+        "Swelling_Ross_mean": "{:8.2f}".format,
+        "sigma_Ross": "{:7.2f}".format,
+    }
+    print(res_df[list(row_fmt)].to_string(index=False, header=False,
+                                          formatters=row_fmt))
+
+    # Save results to CSV
+    csv_path = os.path.join(os.path.dirname(__file__), "..", "data", "monte_carlo_results_computed.csv")
+    res_df.to_csv(csv_path, index=False, float_format="%.4f")
+
+    print(f"\nResults saved to data/monte_carlo_results_computed.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Regenerate every ROADRUNNER figure, table, and computed CSV.
+
+The scripts are independent, so by default each runs in its own worker
+process and their console output is printed in script order once all have
+finished. With ``--jobs 1`` (or ``--show``) they run one after another in
+this interpreter instead.
+
+Usage:
+    python scripts/run_all.py [--jobs N] [--show]
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+from _style import script_args
+
+FIGURE_SCRIPTS = [
+    "figure12_irradiation_conditions",
+    "figure14_fgr_comparison",
+    "figure15_swelling_ross",
+    "sensitivity_analysis",
+]
+TABLE_SCRIPTS = [
+    "monte_carlo_uq",
+]
+
+
+def _run_captured(name):
+    """Run one script's main() in a worker process and return its stdout."""
+    matplotlib.use("Agg")
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        importlib.import_module(name).main()
+    return out.getvalue()
+
+
+def main(show=False, jobs=None):
+    names = FIGURE_SCRIPTS + TABLE_SCRIPTS
+    if jobs is None:
+        jobs = min(len(names), os.cpu_count() or 1)
+
+    if show or jobs == 1:
+        for name in FIGURE_SCRIPTS:
+            importlib.import_module(name).main(show=show)
+        for name in TABLE_SCRIPTS:
+            importlib.import_module(name).main()
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for output in executor.map(_run_captured, names):
+            print(output, end="")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Regenerate all ROADRUNNER figures and tables.")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: one per script, "
+                             "up to the CPU count; 1 runs serially)")
+    args = script_args(None, parser=parser)
+    main(show=args.show, jobs=args.jobs)